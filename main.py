@@ -2,7 +2,24 @@ import streamlit as st
 import pandas as pd
 from datetime import time
 from src.ProctorSchedulingSystem import ProctorSchedulingSystem
-from io import StringIO
+from io import BytesIO
+
+
+# Streamlit reruns the script on every widget change; cache_data keys on the
+# uploaded bytes so the same file is only parsed once (and hands out copies)
+@st.cache_data(show_spinner=False)
+def _load_proctor_csv(data: bytes) -> pd.DataFrame:
+    return pd.read_csv(BytesIO(data))
+
+
+# Repeat clicks with unchanged inputs reuse the previous schedule instead of
+# rerunning the generator, optimizer and presenter
+@st.cache_data(show_spinner=False)
+def _run_scheduler(proctor_df: pd.DataFrame, lab_df: pd.DataFrame) -> str:
+    scheduler = ProctorSchedulingSystem()
+    scheduler.proctors_df = proctor_df
+    scheduler.lab_schedule_df = lab_df
+    return scheduler.generate_schedule()
 
 
 def main():
@@ -43,7 +60,7 @@ def main():
 
     if proctor_file is not None:
         try:
-            proctor_df = pd.read_csv(StringIO(proctor_file.getvalue().decode("utf-8")))
+            proctor_df = _load_proctor_csv(proctor_file.getvalue())
             st.success("Proctor availability file uploaded successfully.")
 
             # Star Proctor Selection and Hours Assignment
@@ -54,8 +71,7 @@ def main():
 
             with col1:
                 st.write("Select Star Proctors")
-                for index, row in proctor_df.iterrows():
-                    proctor_name = row['Name']
+                for proctor_name in proctor_df['Name']:
                     # Use the session state to maintain selections
                     if proctor_name not in st.session_state.star_proctors:
                         st.session_state.star_proctors[proctor_name] = False
@@ -68,8 +84,7 @@ def main():
 
             with col2:
                 st.write("Assign Weekly Hours")
-                for index, row in proctor_df.iterrows():
-                    proctor_name = row['Name']
+                for proctor_name in proctor_df['Name']:
                     if proctor_name not in st.session_state.proctor_hours:
                         st.session_state.proctor_hours[proctor_name] = 4.0
 
@@ -84,9 +99,9 @@ def main():
                     st.session_state.proctor_hours[proctor_name] = hours
 
             # Update the DataFrame with star status and hours
-            proctor_df['Star'] = proctor_df['Name'].map(
-                lambda x: 1 if st.session_state.star_proctors.get(x, False) else 0)
-            proctor_df['MaxHours'] = proctor_df['Name'].map(lambda x: st.session_state.proctor_hours.get(x, 4.0))
+            star_flags = {name: int(star) for name, star in st.session_state.star_proctors.items()}
+            proctor_df['Star'] = proctor_df['Name'].map(star_flags).fillna(0).astype('int8')
+            proctor_df['MaxHours'] = proctor_df['Name'].map(st.session_state.proctor_hours).fillna(4.0)
 
             # Display updated proctor information
             st.subheader("Updated Proctor Information")
@@ -104,13 +119,8 @@ def main():
                         # Create DataFrame from session state for lab schedule
                         lab_df = pd.DataFrame(st.session_state.lab_schedule)
 
-                        # Initialize ProctorSchedulingSystem
-                        scheduler = ProctorSchedulingSystem()
-                        scheduler.proctors_df = st.session_state.proctor_df
-                        scheduler.lab_schedule_df = lab_df
-
                         # Generate schedule
-                        schedule = scheduler.generate_schedule()
+                        schedule = _run_scheduler(st.session_state.proctor_df, lab_df)
                         st.success("Schedule generated successfully!")
                         st.text(schedule)
 
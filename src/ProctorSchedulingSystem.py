@@ -1,12 +1,43 @@
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from pandas.api.types import CategoricalDtype
+from datetime import datetime, time, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+import functools
 import logging
+import re
 from src.SchedulePresenter import SchedulePresenter
 from src.Schedulegenrator import ScheduleGenerator
 from src.ScheduleOptimizer import ScheduleOptimizer
 
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DAY_DTYPE = CategoricalDtype(DAYS, ordered=True)
+
+# Explicit CSV dtypes skip pandas' type inference; Star is read as text so any
+# malformed value still reaches _validate_star_values, which casts it to int8
+PROCTOR_DTYPES = {'Name': 'category', 'Star': 'string', 'MaxHours': 'float32', **{day: 'string' for day in DAYS}}
+LAB_DTYPES = {'Day': 'string', 'StartTime': 'string', 'EndTime': 'string'}
+
+# One or more HH:MM-HH:MM ranges separated by ';'
+_TIME = r'\d{1,2}:\d{2}'
+TIME_RANGES_RE = re.compile(rf'^\s*{_TIME}\s*-\s*{_TIME}(\s*;\s*{_TIME}\s*-\s*{_TIME})*\s*$')
+
+
+def _parse_hhmm(time_str: str) -> datetime.time:
+    """Parse HH:MM (or H:MM) directly instead of going through strptime."""
+    hours, sep, minutes = time_str.strip().partition(':')
+    if not sep or len(hours) not in (1, 2) or len(minutes) != 2 or not (hours + minutes).isdigit():
+        raise ValueError(f"Invalid time: {time_str}")
+    # time() rejects out-of-range hours/minutes with ValueError
+    return time(int(hours), int(minutes))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_range(time_range_str: str) -> Tuple[datetime.time, datetime.time]:
+    """Parse a single HH:MM-HH:MM range; cached since rosters repeat the same cells."""
+    start_str, end_str = time_range_str.split('-')
+    return _parse_hhmm(start_str), _parse_hhmm(end_str)
+
 
 @dataclass
 class TimeRange:
@@ -16,11 +47,8 @@ class TimeRange:
     @classmethod
     def from_string(cls, time_range_str: str) -> 'TimeRange':
         try:
-            start_str, end_str = time_range_str.split('-')
-            return cls(
-                start=datetime.strptime(start_str.strip(), '%H:%M').time(),
-                end=datetime.strptime(end_str.strip(), '%H:%M').time()
-            )
+            start, end = _parse_range(time_range_str)
+            return cls(start=start, end=end)
         except ValueError as e:
             raise ValueError(f"Invalid time range format: {time_range_str}. Expected format: HH:MM-HH:MM") from e
 
@@ -40,9 +68,12 @@ class ProctorSchedulingSystem:
     def load_data(self, proctors_file: str, lab_schedule_file: str) -> None:
         """Load and validate proctor and lab schedule data from CSV files."""
         try:
-            self.proctors_df = pd.read_csv(proctors_file)
-            self.lab_schedule_df = pd.read_csv(lab_schedule_file)
+            self.proctors_df = pd.read_csv(proctors_file, dtype=PROCTOR_DTYPES,
+                                           usecols=lambda col: col in PROCTOR_DTYPES)
+            self.lab_schedule_df = pd.read_csv(lab_schedule_file, dtype=LAB_DTYPES,
+                                               usecols=lambda col: col in LAB_DTYPES)
             self._validate_data()
+            self._categorize_columns()
             self.logger.info("Data loaded successfully")
         except FileNotFoundError as e:
             self.logger.error(f"File not found: {e.filename}")
@@ -62,6 +93,7 @@ class ProctorSchedulingSystem:
         self._check_required_columns(self.proctors_df, required_proctor_columns, "Proctor")
         self._check_required_columns(self.lab_schedule_df, required_lab_columns, "Lab schedule")
 
+        self._validate_days()
         self._validate_time_formats()
         self._validate_star_values()
         self._validate_max_hours()
@@ -73,18 +105,30 @@ class ProctorSchedulingSystem:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
+    def _validate_days(self) -> None:
+        """Validate that lab schedule days are full weekday names."""
+        invalid_days = ~self.lab_schedule_df['Day'].isin(DAYS)
+        if any(invalid_days):
+            invalid_values = self.lab_schedule_df.loc[invalid_days, 'Day'].unique().tolist()
+            raise ValueError(f"Day must be one of {DAYS}. Invalid values: {invalid_values}")
+
     def _validate_time_formats(self) -> None:
         """Validate time formats in both dataframes."""
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-
-        # Validate proctor availability times
-        for day in days:
-            valid_times = self.proctors_df[day].apply(
-                lambda x: self._validate_time_ranges(x) if pd.notna(x) else True
-            )
-            if not all(valid_times):
-                invalid_rows = self.proctors_df[~valid_times]['Name'].tolist()
-                raise ValueError(f"Invalid time format for {day} in rows: {invalid_rows}")
+        # Validate proctor availability times for all days in one pass
+        availability = self.proctors_df.melt(
+            id_vars='Name', value_vars=DAYS, var_name='Day', value_name='TimeRanges'
+        ).dropna(subset=['TimeRanges'])
+        time_ranges = availability['TimeRanges'].astype(str)
+        invalid = ~time_ranges.str.match(TIME_RANGES_RE)
+        # Parsing the well-formed cells also warms the range cache for processing
+        unparsable = [cell for cell in time_ranges[~invalid].unique() if not self._validate_time_ranges(cell)]
+        invalid |= time_ranges.isin(unparsable)
+        if invalid.any():
+            # Name is categorical; group plain values so each day aggregates to a list
+            invalid_rows = (availability.loc[invalid, 'Name'].astype(object)
+                            .groupby(availability.loc[invalid, 'Day'], sort=False).agg(list))
+            details = '; '.join(f"{day} in rows: {names}" for day, names in invalid_rows.items())
+            raise ValueError(f"Invalid time format for {details}")
 
         # Validate lab schedule times
         for col in ['StartTime', 'EndTime']:
@@ -97,22 +141,21 @@ class ProctorSchedulingSystem:
 
     def _validate_time_ranges(self, time_ranges: str) -> bool:
         """Validate individual time ranges in proctor availability."""
-        if pd.isna(time_ranges):
-            return True
-
         try:
-            for time_range in str(time_ranges).split(';'):
-                TimeRange.from_string(time_range.strip())
+            for time_range in time_ranges.split(';'):
+                _parse_range(time_range.strip())
             return True
         except ValueError:
             return False
 
     def _validate_star_values(self) -> None:
         """Validate that Star column contains only 0 or 1."""
-        invalid_stars = ~self.proctors_df['Star'].isin([0, 1])
+        stars = pd.to_numeric(self.proctors_df['Star'], errors='coerce')
+        invalid_stars = ~stars.isin([0, 1])
         if any(invalid_stars):
             invalid_rows = self.proctors_df[invalid_stars]['Name'].tolist()
             raise ValueError(f"Star column must contain only 0 or 1. Invalid rows: {invalid_rows}")
+        self.proctors_df['Star'] = stars.astype('int8')
 
     def _validate_max_hours(self) -> None:
         """Validate that MaxHours contains reasonable values."""
@@ -121,6 +164,10 @@ class ProctorSchedulingSystem:
             invalid_rows = self.proctors_df[invalid_hours]['Name'].tolist()
             raise ValueError(f"MaxHours must be between 1 and 40. Invalid rows: {invalid_rows}")
 
+    def _categorize_columns(self) -> None:
+        """Store the repeated Day labels as an ordered categorical (Name is read as one)."""
+        self.lab_schedule_df['Day'] = self.lab_schedule_df['Day'].astype(DAY_DTYPE)
+
     def generate_schedule(self) -> str:
         """Generate an optimized schedule based on loaded data."""
         if self.proctors_df is None or self.lab_schedule_df is None:
@@ -149,18 +196,25 @@ class ProctorSchedulingSystem:
 
     def _process_proctor_availabilities(self) -> List[Dict[str, Any]]:
         """Process proctor availabilities from dataframe into required format."""
+        columns = ['Name', 'Star', 'MaxHours'] + DAYS
+        name_idx, star_idx, hours_idx, *day_idx = [self.proctors_df.columns.get_loc(col) for col in columns]
+        # Integer proctor ids in name order; a blank Name gets its own id rather
+        # than the -1 sentinel, which would alias the last proctor's stats
+        proctor_ids = pd.factorize(self.proctors_df['Name'], sort=True, use_na_sentinel=False)[0].tolist()
+
         availabilities = []
-        for _, row in self.proctors_df.iterrows():
+        for proctor_id, row in zip(proctor_ids, self.proctors_df.itertuples(index=False, name=None)):
             availability = {
-                'Name': row['Name'],
-                'star': bool(row['Star']),
-                'max_hours': float(row['MaxHours']),
+                'idx': proctor_id,
+                'Name': row[name_idx],
+                'star': bool(row[star_idx]),
+                'max_hours': float(row[hours_idx]),
                 'availability': {}
             }
 
-            for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']:
-                if pd.notna(row[day]):
-                    time_ranges = str(row[day]).split(';')
+            for day, idx in zip(DAYS, day_idx):
+                if pd.notna(row[idx]):
+                    time_ranges = str(row[idx]).split(';')
                     availability['availability'][day] = [
                         self._parse_time_range(time_range.strip())
                         for time_range in time_ranges
@@ -171,16 +225,17 @@ class ProctorSchedulingSystem:
 
     def _process_lab_times(self) -> Dict[str, List[Dict[str, datetime.time]]]:
         """Process lab times from dataframe into required format."""
-        lab_times = {}
-        for _, row in self.lab_schedule_df.iterrows():
-            day = row['Day']
-            if day not in lab_times:
-                lab_times[day] = []
-            lab_times[day].append({
-                'start': row['StartTime'],
-                'end': row['EndTime']
-            })
-        return lab_times
+        if self.lab_schedule_df.empty:
+            return {}
+
+        start = pd.to_timedelta(self.lab_schedule_df['StartTime'].astype(str))
+        end = pd.to_timedelta(self.lab_schedule_df['EndTime'].astype(str))
+        return (self.lab_schedule_df
+                .assign(duration=(end - start).dt.total_seconds() / 3600)
+                .rename(columns={'StartTime': 'start', 'EndTime': 'end'})
+                .groupby('Day', sort=False, observed=True)[['start', 'end', 'duration']]
+                .apply(lambda sessions: sessions.to_dict('records'))
+                .to_dict())
 
     def _parse_time_range(self, time_range_str: str) -> Dict[str, datetime.time]:
         """Parse a time range string into a dictionary with start and end times."""
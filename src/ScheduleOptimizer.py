@@ -1,6 +1,31 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
-import heapq
+from typing import Dict, List, Any, Tuple
+import numpy as np
+
+DAY_ORDER = {day: i for i, day in enumerate(
+    ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])}
+
+
+def _pick_top2(star: np.ndarray,
+               availability: np.ndarray,
+               hours: np.ndarray,
+               feasible: np.ndarray,
+               limit: int = 2) -> np.ndarray:
+    """Return positions of the best `limit` feasible candidates, best first.
+
+    Only plain arrays cross this boundary so the kernel stays self-contained.
+    A session's slots are interchangeable, so the top candidates are also the
+    optimal assignment for it. Ties keep input order.
+    """
+    # Priorities:
+    # 1. Star status (highest priority)
+    # 2. Higher availability
+    # 3. Lower current hours (to balance hours among proctors)
+    scores = np.where(star, 1000, 0) + availability * 10 + (15 - hours)
+    scores[~feasible] = -np.inf
+
+    best = np.argsort(-scores, kind='stable')[:limit]
+    return best[np.isfinite(scores[best])]
+
 
 class ScheduleOptimizer:
     def optimize_schedule(self,
@@ -18,11 +43,12 @@ class ScheduleOptimizer:
         # Sort sessions by time and process them
         sorted_sessions = self._sort_sessions(schedule)
 
-        for day, session, original_proctors in sorted_sessions:
+        for day, session, candidates, candidate_idx in sorted_sessions:
             # Find the best proctors for this session
             best_proctors = self._find_best_proctors(
                 session,
-                original_proctors,
+                candidates,
+                candidate_idx,
                 proctor_stats,
                 max_hours_per_week,
                 min_shift_duration,
@@ -41,102 +67,71 @@ class ScheduleOptimizer:
 
         return optimized_schedule
 
-    def _initialize_proctor_stats(self, schedule: Dict[str, List[Any]]) -> Dict[str, Dict]:
-        stats = {}
-
-        for day_schedule in schedule.values():
-            for session in day_schedule:
-                for proctor in session['proctors']:
-                    Name = proctor['Name']  # Changed from 'Name' to 'name'
-                    if Name not in stats:
-                        stats[Name] = {
-                            'hours': 0,
-                            'star': proctor['star'],
-                            'availability': 0  # Will be counted
-                        }
-                    stats[Name]['availability'] += 1
-
-        return stats
+    def _initialize_proctor_stats(self, schedule: Dict[str, List[Any]]) -> Dict[str, np.ndarray]:
+        # Stats are parallel arrays indexed by each proctor's integer 'idx'
+        assignments = np.array([(proctor['idx'], proctor['star'])
+                                for day_schedule in schedule.values()
+                                for session in day_schedule
+                                for proctor in session['proctors']], dtype=np.intp).reshape(-1, 2)
+        ids = assignments[:, 0]
+        # A negative id would silently index another proctor's stats
+        if ids.size and ids.min() < 0:
+            raise ValueError(f"Proctor ids must be non-negative, got {ids.min()}")
+        size = ids.max() + 1 if ids.size else 0
+
+        star = np.zeros(size, dtype=bool)
+        star[ids] = assignments[:, 1]
+
+        return {
+            'star': star,
+            'availability': np.bincount(ids, minlength=size),  # Appearances per proctor
+            'hours': np.zeros(size)
+        }
 
     def _sort_sessions(self, schedule: Dict[str, List[Any]]) -> List[tuple]:
-        sorted_sessions = []
-
-        for day, day_schedule in schedule.items():
-            for session in day_schedule:
-                # Convert session time to comparable format for sorting
-                start_time = datetime.combine(
-                    datetime.today(),
-                    session['lab_time']['start']
-                )
-                sorted_sessions.append((day, session, session['proctors']))
-
-        # Sort by day and start time
-        return sorted(sorted_sessions,
-                      key=lambda x: (x[0], x[1]['lab_time']['start']))
+        sorted_sessions = [(day, session, *self._index_candidates(session['proctors']))
+                           for day, day_schedule in schedule.items()
+                           for session in day_schedule]
+
+        # Sort by calendar day and start time
+        sorted_sessions.sort(key=lambda x: (DAY_ORDER.get(x[0], len(DAY_ORDER)),
+                                            x[1]['lab_time']['start']))
+        return sorted_sessions
+
+    def _index_candidates(self, proctors: List[Dict]) -> Tuple[List[Dict], np.ndarray]:
+        # Order a session's candidate pool by id once, alongside the ids used to
+        # index the stats arrays. Ids follow name order, so ties resolve by name.
+        candidates = sorted(proctors, key=lambda proctor: proctor['idx'])
+        candidate_idx = np.fromiter((proctor['idx'] for proctor in candidates),
+                                    dtype=np.int32, count=len(candidates))
+        return candidates, candidate_idx
 
     def _find_best_proctors(self,
                             session: Dict,
-                            original_proctors: List[Dict],
-                            proctor_stats: Dict[str, Dict],
+                            candidates: List[Dict],
+                            candidate_idx: np.ndarray,
+                            proctor_stats: Dict[str, np.ndarray],
                             max_hours_per_week: float,
                             min_shift_duration: float,
                             max_shift_duration: float) -> List[Dict]:
 
-        # Calculate session duration
-        session_start = session['lab_time']['start']
-        session_end = session['lab_time']['end']
-        session_duration = (datetime.combine(datetime.min, session_end) -
-                            datetime.combine(datetime.min, session_start)).seconds / 3600
+        session_duration = session['lab_time']['duration']
 
         # Skip if session duration is outside bounds
         if session_duration < min_shift_duration or session_duration > max_shift_duration:
             return []
 
-        # Priority queue for selecting best proctors
-        proctor_queue = []
-
-        for proctor in original_proctors:
-            Name = proctor['Name']  # Changed from 'Name' to 'name'
-            stats = proctor_stats[Name]
-
-            # Skip if adding this session would exceed max hours
-            if stats['hours'] + session_duration > max_hours_per_week:
-                continue
-
-            # Calculate priority score
-            priority_score = self._calculate_priority_score(stats, session_duration)
-
-            heapq.heappush(proctor_queue,
-                           (-priority_score, Name, proctor))  # Negative for max-heap
-
-        # Select best proctors
-        selected_proctors = []
-        while proctor_queue and len(selected_proctors) < 2:  # Limit to 2 proctors per session
-            _, _, proctor = heapq.heappop(proctor_queue)
-            selected_proctors.append(proctor)
-
-        return selected_proctors
-
-    def _calculate_priority_score(self,
-                                  stats: Dict[str, Any],
-                                  session_duration: float) -> float:
-        # Priorities:
-        # 1. Star status (highest priority)
-        # 2. Higher availability
-        # 3. Lower current hours (to balance hours among proctors)
-
-        star_factor = 1000 if stats['star'] else 0
-        availability_factor = stats['availability'] * 10
-        hours_factor = 15 - stats['hours']  # Inverse of current hours
+        hours = proctor_stats['hours'][candidate_idx]
 
-        return star_factor + availability_factor + hours_factor
+        best = _pick_top2(proctor_stats['star'][candidate_idx],
+                          proctor_stats['availability'][candidate_idx],
+                          hours,
+                          hours + session_duration <= max_hours_per_week)
+        # best indexes the id-sorted candidates, not session['proctors']
+        return [candidates[i] for i in best]
 
     def _update_proctor_hours(self,
                               proctors: List[Dict],
-                              proctor_stats: Dict[str, Dict]):
+                              proctor_stats: Dict[str, np.ndarray]):
         for proctor in proctors:
-            Name = proctor['Name']  # Changed from 'Name' to 'name'
-            assigned_time = proctor['assigned_time']
-            duration = (datetime.combine(datetime.min, assigned_time['end']) -
-                        datetime.combine(datetime.min, assigned_time['start'])).seconds / 3600
-            proctor_stats[Name]['hours'] += duration
\ No newline at end of file
+            proctor_stats['hours'][proctor['idx']] += proctor['assigned_time']['duration']
\ No newline at end of file
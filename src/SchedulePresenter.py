@@ -1,4 +1,31 @@
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+
+@lru_cache(maxsize=1024)
+def _format_proctor(name: str, star: bool) -> str:
+    """
+    Format one proctor line; the same proctor recurs across sessions and days.
+
+    :param name: Proctor name
+    :param star: Whether the proctor is a star proctor
+    :return: The formatted proctor line
+    """
+    return f"    - {name} ({'Star' if star else 'Regular'})"
+
+
+@lru_cache(maxsize=1024)
+def _format_session(start, end, proctors: Tuple[Tuple[str, bool], ...]) -> str:
+    """
+    Format one session block. Cached at module level so sessions that are
+    unchanged between Streamlit reruns are not formatted again.
+
+    :param start: Session start time
+    :param end: Session end time
+    :param proctors: (name, star) pairs of the assigned proctors
+    :return: The formatted session lines
+    """
+    return "\n".join([f"  {start} - {end}:", *(_format_proctor(name, star) for name, star in proctors)])
 
 
 class SchedulePresenter:
@@ -9,17 +36,19 @@ class SchedulePresenter:
         :param schedule: The optimized schedule dictionary
         :return: A formatted string representation of the schedule
         """
-        formatted_schedule = []
-
-        for day, sessions in schedule.items():
-            formatted_schedule.append(f"\n{day}:")
-
-            for session in sessions:
-                lab_time = session['lab_time']
-                proctors = session['proctors']
+        return "\n".join(
+            line
+            for day, sessions in schedule.items()
+            for line in [f"\n{day}:", *(self._session_block(session) for session in sessions)]
+        )
 
-                formatted_schedule.append(f"  {lab_time['start']} - {lab_time['end']}:")
-                for proctor in proctors:
-                    formatted_schedule.append(f"    - {proctor['Name']} ({'Star' if proctor['star'] else 'Regular'})")
+    def _session_block(self, session: Dict[str, Any]) -> str:
+        """
+        Look up the cached text for one scheduled session.
 
-        return "\n".join(formatted_schedule)
\ No newline at end of file
+        :param session: A session with 'lab_time' and 'proctors'
+        :return: The formatted session lines
+        """
+        lab_time = session['lab_time']
+        proctors = tuple((proctor['Name'], proctor['star']) for proctor in session['proctors'])
+        return _format_session(lab_time['start'], lab_time['end'], proctors)
\ No newline at end of file
@@ -1,28 +1,83 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
+from datetime import datetime, time, timedelta
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from dataclasses import dataclass
-import heapq
+import numpy as np
+
+
+def _to_minutes(t: datetime.time) -> int:
+    return t.hour * 60 + t.minute
+
+
+def _to_time(minutes: int) -> datetime.time:
+    return time(*divmod(int(minutes), 60))
+
+
+def _score_candidates(starts: np.ndarray,
+                      ends: np.ndarray,
+                      reach: np.ndarray,
+                      proctor_idx: np.ndarray,
+                      weekly_hours: np.ndarray,
+                      baseline: np.ndarray,
+                      lab_lo: int,
+                      lab_hi: int,
+                      min_shift: float,
+                      max_shift: float,
+                      max_weekly: float,
+                      limit: int) -> Tuple[np.ndarray, ...]:
+    # Overlap, shift/weekly-cap filtering, scoring and top-k selection for one
+    # lab session over a day's slot arrays (sorted by start), on plain arrays
+    # only. Returns the proctor positions, overlap bounds and durations (hours)
+    # of at most `limit` winners, best first.
+
+    # Only slots starting before the lab ends can overlap it, and every slot
+    # before the first one whose running max end passes the lab start is
+    # disjoint from it; both bounds skip non-overlapping slots untouched
+    first = np.searchsorted(reach, lab_lo, side='right')
+    n = np.searchsorted(starts, lab_hi)
+    overlap_lo = np.maximum(starts[first:n], lab_lo)
+    overlap_hi = np.minimum(ends[first:n], lab_hi)
+    # Widen before subtracting: slots ending before the lab starts would wrap in uint16
+    minutes = overlap_hi.astype(np.int32) - overlap_lo
+    durations = minutes / 60.0
+    owners = proctor_idx[first:n]
+    hours = weekly_hours[owners]
+
+    valid = ((minutes >= min_shift * 60) &
+             (minutes <= max_shift * 60) &
+             (hours + durations <= max_weekly))
+    owners, hours = owners[valid], hours[valid]
+
+    # Only the weekly-hours term of the score changes during a run
+    scores = baseline[owners] - hours
+
+    # Stable so that equal scores keep slot order
+    top = np.argsort(-scores, kind='stable')[:limit]
+
+    return owners[top], overlap_lo[valid][top], overlap_hi[valid][top], durations[valid][top]
 
 
 @dataclass
 class TimeSlot:
-    start: datetime.time
-    end: datetime.time
+    # Declared by hand rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('start_min', 'end_min')
+    start_min: int
+    end_min: int
+
+    @classmethod
+    def from_time(cls, start: datetime.time, end: datetime.time) -> 'TimeSlot':
+        return cls(start_min=_to_minutes(start), end_min=_to_minutes(end))
 
     def duration_hours(self) -> float:
-        return ((datetime.combine(datetime.min, self.end) -
-                 datetime.combine(datetime.min, self.start)).seconds / 3600)
+        return (self.end_min - self.start_min) * (1 / 60.0)
 
     def overlaps_with(self, other: 'TimeSlot') -> bool:
-        return (self.start <= other.end and self.end >= other.start)
+        # Slots that merely touch at an endpoint do not overlap
+        return self.start_min < other.end_min and other.start_min < self.end_min
 
-    def get_overlap(self, other: 'TimeSlot') -> 'TimeSlot':
-        if not self.overlaps_with(other):
-            return None
-        return TimeSlot(
-            start=max(self.start, other.start),
-            end=min(self.end, other.end)
-        )
+    def get_overlap(self, other: 'TimeSlot') -> Optional['TimeSlot']:
+        lo = max(self.start_min, other.start_min)
+        hi = min(self.end_min, other.end_min)
+        return TimeSlot(lo, hi) if hi > lo else None
 
 
 class ScheduleGenerator:
@@ -32,123 +87,163 @@ class ScheduleGenerator:
         self.min_shift_duration = min_shift_duration
         self.max_shift_duration = max_shift_duration
         self.max_weekly_hours = max_weekly_hours
-        self.proctor_weekly_hours = {}
+        self.proctor_weekly_hours = np.zeros(0)
+        self._star = np.zeros(0, dtype=bool)
+        self._avail_factor = np.zeros(0, dtype=np.int32)
+        self._baseline = np.zeros(0)
+        self._names = []
+        self._ids = []
+        self._starts = {}
+        self._ends = {}
+        self._reach = {}
+        self._proctor_idx = {}
 
     def generate_schedule(self,
                           proctor_availabilities: List[Dict],
                           lab_times: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
-        # Initialize schedule and proctor tracking
         schedule = {day: [] for day in lab_times.keys()}
-        self._initialize_proctor_hours(proctor_availabilities)
-
-        # Process each day's lab sessions
-        for day, lab_sessions in lab_times.items():
-            day_schedule = self._generate_day_schedule(
-                day, lab_sessions, proctor_availabilities)
-            schedule[day] = day_schedule
+        for day, lab_session, proctors in self.iter_schedule(proctor_availabilities, lab_times):
+            schedule[day].append({
+                'lab_time': lab_session,
+                'proctors': proctors
+            })
 
         return schedule
 
-    def _initialize_proctor_hours(self, proctor_availabilities: List[Dict]):
-        self.proctor_weekly_hours = {
-            proctor['Name']: 0 for proctor in proctor_availabilities
-        }
+    def iter_schedule(self,
+                      proctor_availabilities: List[Dict],
+                      lab_times: Dict[str, List[Dict]]) -> Iterator[Tuple[str, Dict, List[Dict]]]:
+        # Stream (day, lab session, assigned proctors) for every staffed session
+        # in schedule order, for callers that write entries out as they go
+        # instead of holding the whole schedule
+        self._initialize_proctor_hours(proctor_availabilities)
+        self._precompute(self._normalize_availabilities(proctor_availabilities, lab_times))
 
-    def _generate_day_schedule(self,
-                               day: str,
-                               lab_sessions: List[Dict],
-                               proctor_availabilities: List[Dict]) -> List[Dict]:
-        day_schedule = []
+        # Sort every day's lab sessions by start time up front
+        sorted_lab_times = {day: sorted(lab_sessions, key=lambda x: x['start'])
+                            for day, lab_sessions in lab_times.items()}
 
-        # Sort lab sessions by start time
-        sorted_sessions = sorted(lab_sessions,
-                                 key=lambda x: x['start'])
+        # Process each day's lab sessions
+        for day, lab_sessions in sorted_lab_times.items():
+            for lab_session, proctors in self._iter_day_schedule(day, lab_sessions):
+                yield day, lab_session, proctors
 
-        for lab_session in sorted_sessions:
-            lab_slot = TimeSlot(start=lab_session['start'],
-                                end=lab_session['end'])
+    def _initialize_proctor_hours(self, proctor_availabilities: List[Dict]):
+        # Parallel arrays/lists indexed by proctor position; only weekly hours
+        # change during a run, and results read names/ids back by position
+        self.proctor_weekly_hours = np.zeros(len(proctor_availabilities))
+        self._star = np.array([proctor['star'] for proctor in proctor_availabilities], dtype=bool)
+        self._avail_factor = np.array([
+            sum(len(slots) for slots in proctor['availability'].values())
+            for proctor in proctor_availabilities
+        ], dtype=np.int32)
+
+        # Factors to consider:
+        # 1. Star status (highest priority)
+        # 2. Current weekly hours (to balance workload)
+        # 3. Total availability (prefer those with more availability)
+        # Everything but the weekly hours is fixed, so the score reduces to
+        # baseline minus current hours
+        self._baseline = np.where(self._star, 1000, 0) + self.max_weekly_hours + self._avail_factor * 0.1
+        self._names = [proctor['Name'] for proctor in proctor_availabilities]
+        self._ids = [proctor['idx'] for proctor in proctor_availabilities]
+
+    def _normalize_availabilities(self,
+                                  proctor_availabilities: List[Dict],
+                                  lab_times: Dict[str, List[Dict]]) -> Dict[str, List[Tuple[int, int, int]]]:
+        # Pack every availability slot on a lab day once, in a single pass over
+        # the proctors, into (start minute, end minute, proctor position); the
+        # caller's dicts are left untouched
+        packed = {day: [] for day in lab_times}
+        for i, proctor in enumerate(proctor_availabilities):
+            for day, slots in proctor['availability'].items():
+                day_slots = packed.get(day)
+                if day_slots is not None:
+                    day_slots.extend((_to_minutes(slot['start']), _to_minutes(slot['end']), i) for slot in slots)
+        return packed
+
+    def _precompute(self, packed: Dict[str, List[Tuple[int, int, int]]]):
+        # Turn each day's packed slots into parallel arrays of start/end minutes
+        # plus the owning proctor's position, sorted by start, instead of
+        # rebuilding slots per lab session
+        self._starts, self._ends, self._reach, self._proctor_idx = {}, {}, {}, {}
+        for day, day_slots in packed.items():
+            slots = sorted(day_slots, key=lambda slot: slot[0])
+            starts, ends, proctor_idx = zip(*slots) if slots else ((), (), ())
+
+            # Minutes since midnight fit in uint16; times are only rebuilt for results
+            self._starts[day] = np.array(starts, dtype=np.uint16)
+            self._ends[day] = np.array(ends, dtype=np.uint16)
+            # Running max of slot ends, i.e. the latest time reached by any slot so far
+            self._reach[day] = np.maximum.accumulate(self._ends[day])
+            self._proctor_idx[day] = np.array(proctor_idx, dtype=np.intp)
+
+    def _iter_day_schedule(self,
+                           day: str,
+                           lab_sessions: List[Dict]) -> Iterator[Tuple[Dict, List[Dict]]]:
+        # lab_sessions arrive sorted by start time
+        for lab_session in lab_sessions:
+            lab_slot = TimeSlot.from_time(lab_session['start'], lab_session['end'])
 
             if lab_slot.duration_hours() < self.min_shift_duration:
                 continue  # Skip sessions that are too short
 
-            assigned_proctors = self._assign_proctors_to_session(
-                lab_slot, proctor_availabilities, day)
+            assigned_proctors = self._assign_proctors_to_session(lab_slot, day)
 
             if assigned_proctors:
-                day_schedule.append({
-                    'lab_time': lab_session,
-                    'proctors': assigned_proctors
-                })
-
-        return day_schedule
+                yield lab_session, assigned_proctors
 
     def _assign_proctors_to_session(self,
                                     lab_slot: TimeSlot,
-                                    proctor_availabilities: List[Dict],
                                     day: str) -> List[Dict]:
-        # Priority queue to select best proctors
-        proctor_candidates = []
-
-        for proctor in proctor_availabilities:
-            if day not in proctor['availability']:
-                continue
-
-            for avail_slot in map(lambda x: TimeSlot(**x),
-                                  proctor['availability'][day]):
-                overlap = lab_slot.get_overlap(avail_slot)
-
-                if overlap and self._is_valid_assignment(
-                        proctor['Name'], overlap.duration_hours()):
-                    priority_score = self._calculate_priority_score(
-                        proctor, overlap.duration_hours())
-
-                    heapq.heappush(
-                        proctor_candidates,
-                        (-priority_score, proctor, overlap)  # Negative for max-heap
-                    )
-
-        return self._select_best_proctors(proctor_candidates, lab_slot)
-
-    def _is_valid_assignment(self, proctor_name: str, duration: float) -> bool:
-        current_hours = self.proctor_weekly_hours[proctor_name]
-        return (duration >= self.min_shift_duration and
-                duration <= self.max_shift_duration and
-                current_hours + duration <= self.max_weekly_hours)
-
-    def _calculate_priority_score(self,
-                                  proctor: Dict,
-                                  duration: float) -> float:
-        # Factors to consider:
-        # 1. Star status (highest priority)
-        # 2. Current weekly hours (to balance workload)
-        # 3. Total availability (prefer those with more availability)
+        target_proctors = 2  # We want 2 proctors per session if possible
 
-        star_factor = 1000 if proctor['star'] else 0
-        hours_factor = self.max_weekly_hours - self.proctor_weekly_hours[proctor['Name']]
-        availability_factor = sum(len(slots) for slots in
-                                  proctor['availability'].values())
+        # Only the winners leave the kernel; rejected candidates never become Python objects
+        winners = _score_candidates(
+            self._starts[day], self._ends[day], self._reach[day], self._proctor_idx[day],
+            self.proctor_weekly_hours, self._baseline,
+            lab_slot.start_min, lab_slot.end_min,
+            self.min_shift_duration, self.max_shift_duration, self.max_weekly_hours,
+            target_proctors)
 
-        return star_factor + hours_factor + (availability_factor * 0.1)
+        return self._select_best_proctors(*winners)
 
     def _select_best_proctors(self,
-                              candidates: List[Tuple],
-                              lab_slot: TimeSlot) -> List[Dict]:
+                              owners: np.ndarray,
+                              overlap_lo: np.ndarray,
+                              overlap_hi: np.ndarray,
+                              durations: np.ndarray) -> List[Dict]:
         selected_proctors = []
-        target_proctors = 2  # We want 2 proctors per session if possible
-
-        while candidates and len(selected_proctors) < target_proctors:
-            _, proctor, overlap = heapq.heappop(candidates)
 
+        for proctor_idx, overlap_lo, overlap_hi, duration in zip(
+                owners.tolist(), overlap_lo.tolist(), overlap_hi.tolist(), durations.tolist()):
             # Update proctor's weekly hours
-            self.proctor_weekly_hours[proctor['Name']] += overlap.duration_hours()
+            self.proctor_weekly_hours[proctor_idx] += duration
+            if self.proctor_weekly_hours[proctor_idx] + self.min_shift_duration > self.max_weekly_hours:
+                self._retire_proctor(proctor_idx)
 
             selected_proctors.append({
-                'Name': proctor['Name'],
-                'star': proctor['star'],
+                'idx': self._ids[proctor_idx],
+                'Name': self._names[proctor_idx],
+                'star': bool(self._star[proctor_idx]),
                 'assigned_time': {
-                    'start': overlap.start,
-                    'end': overlap.end
+                    'start': _to_time(overlap_lo),
+                    'end': _to_time(overlap_hi),
+                    'duration': duration
                 }
             })
 
         return selected_proctors
+
+    def _retire_proctor(self, proctor_idx: int):
+        # A proctor who can no longer fit even a minimum shift under the weekly
+        # cap stays ineligible for the rest of the run, so drop their slots from
+        # every day's arrays once instead of re-filtering them per session
+        for day, owners in self._proctor_idx.items():
+            keep = owners != proctor_idx
+            if keep.all():
+                continue
+            self._starts[day] = self._starts[day][keep]
+            self._ends[day] = self._ends[day][keep]
+            self._reach[day] = np.maximum.accumulate(self._ends[day])
+            self._proctor_idx[day] = owners[keep]